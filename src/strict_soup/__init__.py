@@ -2,21 +2,132 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast, override
-
-from bs4 import BeautifulSoup
+import re
+from functools import cache, lru_cache
+from importlib.util import find_spec
+from itertools import islice
+from typing import TYPE_CHECKING, Self, cast, override
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 from bs4.element import ResultSet, Tag
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
     from typing import Any
 
     from _typeshed import SupportsRead
-    from bs4 import SoupStrainer
     from bs4.builder import TreeBuilder
     from bs4.element import PageElement
 
 
+# Selectors made of a tag name followed by any number of #id, .class, [attr] and
+# [attr=value] parts, anything more complex can't be turned into a SoupStrainer.
+_SIMPLE_SELECTOR_RE = re.compile(
+    r"(?P<name>[a-zA-Z][\w-]*)?"
+    r"(?P<parts>(?:[#.][\w-]+|\[[\w-]+(?:=(?:\"[^\"]*\"|'[^']*'|[^\]\"'\s]*))?\])*)",
+)
+_SELECTOR_PART_RE = re.compile(
+    r"#(?P<id>[\w-]+)"
+    r"|\.(?P<class>[\w-]+)"
+    r"|\[(?P<attr>[\w-]+)(?:=(?P<value>\"[^\"]*\"|'[^']*'|[^\]\"'\s]*))?\]",
+)
+
+# Selectors that are only a lowercase tag name. HTML tag names are matched
+# case-insensitively because html5lib keeps the case of SVG and MathML elements
+# such as foreignObject.
+_TAG_NAME_RE = re.compile(r"[a-z][a-z0-9-]*")
+
+
+def _selector_part_to_attr(
+    part: re.Match[str],
+    *,
+    html: bool,
+) -> tuple[str, str | bool | re.Pattern[str]]:
+    """Convert an #id, [attr] or [attr=value] part of a selector.
+
+    Args:
+        part: A match of _SELECTOR_PART_RE that is not a .class part.
+
+        html: If attribute names should be lowercased and the type attribute
+            should be matched case-insensitively.
+
+    Returns:
+        The attribute name and the value SoupStrainer should match against.
+    """
+    if part.group("id") is not None:
+        return "id", part.group("id")
+
+    key = part.group("attr").lower() if html else part.group("attr")
+    if part.group("value") is None:
+        return key, True
+
+    value = part.group("value").strip("\"'")
+    # SoupSieve matches the value of the HTML type attribute case-insensitively.
+    if html and key == "type":
+        return key, re.compile(rf"\A{re.escape(value)}\Z", re.IGNORECASE)
+
+    return key, value
+
+
+def _selector_to_strainer(selector: str, *, html: bool = True) -> SoupStrainer:
+    """Convert a simple CSS selector into a SoupStrainer.
+
+    Args:
+        selector: A CSS selector made of an optional tag name followed by any
+            number of #id, .class, [attr] and [attr=value] parts.
+
+        html: If the document will be parsed as HTML. HTML parsers lowercase tag
+            and attribute names, and CSS matches them case-insensitively, so the
+            names in the selector are lowercased to match.
+
+    Returns:
+        A SoupStrainer that matches the same tags as the selector.
+
+    Raises:
+        ValueError: When the selector can't be converted.
+    """
+    match = _SIMPLE_SELECTOR_RE.fullmatch(selector.strip())
+    if match is None or not match.group(0):
+        msg = f"Selector is too complex to convert to a SoupStrainer: {selector}"
+        raise ValueError(msg)
+
+    attrs: dict[str, str | bool | re.Pattern[str]] = {}
+    classes: list[str] = []
+    for part in _SELECTOR_PART_RE.finditer(match.group("parts")):
+        if part.group("class") is not None:
+            classes.append(part.group("class"))
+            continue
+
+        key, value = _selector_part_to_attr(part, html=html)
+
+        # SoupStrainer only accepts a single value per attribute.
+        if key in attrs:
+            msg = f"Selector uses {key} more than once: {selector}"
+            raise ValueError(msg)
+
+        attrs[key] = value
+
+    # The class attribute has not been split into a list yet when the
+    # SoupStrainer is checked during parsing, so each class has to be matched
+    # as a whole word.
+    if classes:
+        # .class and [class] parts would both need the class key.
+        if "class" in attrs:
+            msg = f"Selector uses both .class and [class]: {selector}"
+            raise ValueError(msg)
+
+        lookaheads = "".join(rf"(?=.*(?:^|\s){re.escape(c)}(?:\s|$))" for c in classes)
+        attrs["class"] = re.compile(lookaheads)
+
+    name = match.group("name")
+    if html and name is not None:
+        name = name.lower()
+
+    return SoupStrainer(name, attrs)
+
+
 def _convert_to_strict_tag(tag: Tag | None) -> StrictTag:
     """Convert a Tag to a StrictTag.
 
@@ -33,13 +144,198 @@ def _convert_to_strict_tag(tag: Tag | None) -> StrictTag:
         msg = "Cannot convert None to StrictTag"
         raise ValueError(msg)
 
+    # The class was just changed so the tag really is a StrictTag, calling cast
+    # would only add a function call at runtime.
     tag.__class__ = StrictTag
-    return cast(StrictTag, tag)
+    return tag  # type: ignore[reportReturnType]
+
+
+@cache
+def _lxml_available() -> bool:
+    """Check if lxml is installed.
+
+    This is cached so the import system is only searched once per process.
+    """
+    return find_spec("lxml") is not None
+
+
+def _is_tag_name_selector(
+    tag: Tag,
+    selector: str | sv.SoupSieve,
+    namespaces: dict[str, str] | None,
+    flags: int,
+) -> bool:
+    """Check if a selector can be matched by comparing tag names.
+
+    Args:
+        tag: The Tag the selector will be run on.
+
+        selector: The selector passed into select, which may be a selector
+            compiled with soupsieve.compile.
+
+        namespaces: The namespaces passed into select.
+
+        flags: The flags passed into select.
+
+    Returns:
+        True if the selector only matches tags by name in an HTML document.
+    """
+    return (
+        isinstance(selector, str)
+        and namespaces is None
+        and not flags
+        # bs4 has no public way to check this for a Tag.
+        and not tag._is_xml  # type: ignore[reportPrivateUsage]  # noqa: SLF001  # pylint: disable=protected-access
+        and _TAG_NAME_RE.fullmatch(selector) is not None
+    )
+
+
+def _iter_tags_by_name(tag: Tag, name: str) -> Iterator[Tag]:
+    """Iterate over the descendants of a tag with a specific name.
+
+    This gives the same results as selecting a plain tag name with SoupSieve but
+    is several times faster because no selector matching is done per tag.
+
+    Args:
+        tag: The Tag to search.
+
+        name: The lowercase tag name to look for.
+
+    Returns:
+        An iterator of matching tags in document order.
+    """
+    # Comparing the name as is first avoids lowercasing every matching tag.
+    return (
+        child
+        for child in tag.descendants
+        if isinstance(child, Tag) and (child.name == name or child.name.lower() == name)
+    )
+
+
+def _freeze(namespaces: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    """Convert a namespaces dictionary into a hashable tuple.
+
+    Args:
+        namespaces: A dictionary mapping namespace prefixes to namespace URIs.
+
+    Returns:
+        A sorted tuple of (prefix, URI) pairs.
+    """
+    # HTML documents almost never declare namespaces, so skip building and
+    # sorting a list for the empty dictionary. A dict can't be used as a weak
+    # key and may be mutated, so non-empty dictionaries are not cached.
+    if not namespaces:
+        return ()
+
+    return tuple(sorted(namespaces.items()))
+
+
+@lru_cache(maxsize=512)
+def _compile(
+    selector: str,
+    namespaces_key: tuple[tuple[str, str], ...],
+    flags: int,
+) -> sv.SoupSieve:
+    """Compile a CSS selector, reusing the result for repeated selectors.
+
+    Args:
+        selector: A string containing a CSS selector.
+
+        namespaces_key: Namespaces frozen with _freeze.
+
+        flags: Flags to be passed into soupsieve.compile().
+
+    Returns:
+        The compiled SoupSieve selector.
+    """
+    return sv.compile(selector, dict(namespaces_key), flags)
+
+
+# Selectors that can be answered by _SelectorIndex, a single #id, .class or
+# lowercase tag name. The tag name reuses _TAG_NAME_RE so the index and the tag
+# name fast path in select agree on what a plain tag name is.
+_INDEXED_SELECTOR_RE = re.compile(
+    r"#(?P<id>-?[_a-zA-Z][\w-]*)"
+    r"|\.(?P<class>-?[_a-zA-Z][\w-]*)"
+    rf"|(?P<name>{_TAG_NAME_RE.pattern})",
+)
+
+
+# Key in the __dict__ of indexed tags that points back to their _SelectorIndex.
+# It is read from __dict__ directly because Tag.__getattr__ treats unknown
+# attributes as a search for a child tag.
+_INDEX_KEY = "_strict_soup_index"
+
+
+# The index is only a set of lookup tables, so one public method is enough.
+class _SelectorIndex:  # pylint: disable=too-few-public-methods
+    """Lookup tables for the tags in a document by id, class and tag name."""
+
+    def __init__(self, root: Tag) -> None:
+        """Index every tag under root.
+
+        The indexed tags are converted to StrictTag so lookups can return them
+        as is, and each of them keeps a reference to the index so adding or
+        removing tags can mark it as stale.
+
+        Args:
+            root: The Tag to index.
+        """
+        self.stale = False
+        self.ids: dict[str, list[Tag]] = {}
+        self.classes: dict[str, list[Tag]] = {}
+        self.names: dict[str, list[Tag]] = {}
+
+        root.__dict__[_INDEX_KEY] = self
+        for tag in root.descendants:
+            if not isinstance(tag, Tag):
+                continue
+
+            tag.__class__ = StrictTag
+            tag.__dict__[_INDEX_KEY] = self
+            # HTML tag names are matched case-insensitively, see _TAG_NAME_RE.
+            self.names.setdefault(tag.name.lower(), []).append(tag)
+
+            tag_id = tag.attrs.get("id")
+            if isinstance(tag_id, str):
+                self.ids.setdefault(tag_id, []).append(tag)
+
+            classes = tag.attrs.get("class")
+            if isinstance(classes, str):
+                classes = classes.split()
+            if isinstance(classes, list):
+                # dict.fromkeys removes duplicate classes while keeping the order.
+                for name in dict.fromkeys(classes):
+                    self.classes.setdefault(name, []).append(tag)
+
+    def lookup(self, selector: str) -> list[Tag] | None:
+        """Find the tags matching a selector.
+
+        Args:
+            selector: A string containing a CSS selector.
+
+        Returns:
+            The matching tags in document order, or None if the selector can't
+            be answered from the index.
+        """
+        match = _INDEXED_SELECTOR_RE.fullmatch(selector)
+        if match is None:
+            return None
+
+        if match.group("id") is not None:
+            return self.ids.get(match.group("id"), [])
+
+        if match.group("class") is not None:
+            return self.classes.get(match.group("class"), [])
+
+        return self.names.get(match.group("name"), [])
 
 
 class StrictSelectError(Exception):
     """Exception raised when a strict_* function fails to find a match."""
 
+    __slots__ = ()
+
 
 class StrictTag(Tag):
     """Mixin for adding extra functions to BeautifulSoup objects."""
@@ -76,11 +372,30 @@ class StrictTag(Tag):
         Returns:
             A ResultSet of StrictTag objects.
         """
-        output = super().select(selector, namespaces, limit, **kwargs)
-        return ResultSet(
-            output.source,
-            [_convert_to_strict_tag(item) for item in output],
-        )
+        # Skip the dictionary lookup when no keyword arguments were passed.
+        flags = kwargs.pop("flags", 0) if kwargs else 0
+        if kwargs or not isinstance(selector, str):
+            # Arguments such as custom or ignore can't be cached, and bs4 already
+            # handles selectors that were compiled with soupsieve.compile.
+            output = super().select(selector, namespaces, limit, flags=flags, **kwargs)
+        elif _is_tag_name_selector(self, selector, namespaces, flags):
+            tags = _iter_tags_by_name(self, selector)
+            output = ResultSet(None, islice(tags, limit or None))
+        else:
+            if namespaces is None:
+                namespaces = self._namespaces  # type: ignore[reportPrivateUsage]
+            compiled = _compile(selector, _freeze(namespaces), flags)
+            # Build the ResultSet straight from the iterator, compiled.select
+            # would build a list that ResultSet then copies.
+            output = ResultSet(None, compiled.iselect(self, limit or 0))
+
+        # Converting the tags in place avoids building a second list, and the
+        # local name avoids a global lookup on every iteration.
+        strict_tag = StrictTag
+        for item in output:
+            item.__class__ = strict_tag
+
+        return cast("ResultSet[StrictTag]", output)
 
     @override
     def select_one(
@@ -106,7 +421,20 @@ class StrictTag(Tag):
         Returns:
             A StrictTag or None.
         """
-        output = super().select_one(selector, namespaces, **kwargs)
+        # Skip the dictionary lookup when no keyword arguments were passed.
+        flags = kwargs.pop("flags", 0) if kwargs else 0
+        if kwargs or not isinstance(selector, str):
+            # Arguments such as custom or ignore can't be cached, and bs4 already
+            # handles selectors that were compiled with soupsieve.compile.
+            output = super().select_one(selector, namespaces, flags=flags, **kwargs)
+        elif _is_tag_name_selector(self, selector, namespaces, flags):
+            output = next(_iter_tags_by_name(self, selector), None)
+        else:
+            if namespaces is None:
+                namespaces = self._namespaces  # type: ignore[reportPrivateUsage]
+            compiled = _compile(selector, _freeze(namespaces), flags)
+            output = compiled.select_one(self)
+
         if output is not None:
             return _convert_to_strict_tag(output)
 
@@ -141,7 +469,7 @@ class StrictTag(Tag):
             StrictSelectError: When no matches are found.
         """
         output = self.select(selector, namespaces, limit, **kwargs)
-        if len(output) == 0:
+        if not output:
             msg = f"No matches found for strict_select({selector})"
             raise StrictSelectError(msg)
 
@@ -165,7 +493,9 @@ class StrictTag(Tag):
                 selector to namespace URI2s. By default, Beautiful Soup will use
                 the prefixes it encountered while parsing the document.
 
-            limit: After finding this number of results, stop looking.
+            limit: After finding this number of results, stop looking. Values
+                above 2 have no effect because the search always stops after
+                the second match.
 
             kwargs: Keyword arguments to be passed into SoupSieve's
                 soupsieve.select() method.
@@ -173,12 +503,20 @@ class StrictTag(Tag):
         Raises:
             StrictSelectError: When there is not exactly one match.
         """
-        output = self.strict_select(selector, namespaces, limit, **kwargs)
-        if len(output) != 1:
-            msg = f"Found {len(output)} matches for strict_select_one({selector})"
-            raise StrictSelectError(msg)
-
-        return output[0]
+        # Two matches are enough to know there is more than one match, so there
+        # is no reason to keep searching the rest of the document.
+        output = self.select(selector, namespaces, min(limit or 2, 2), **kwargs)
+        # Check for the expected single match first so the common case only
+        # does one comparison.
+        count = len(output)
+        if count == 1:
+            return output[0]
+
+        if count == 0:
+            msg = f"No matches found for strict_select_one({selector})"
+        else:
+            msg = f"Found multiple matches for strict_select_one({selector})"
+        raise StrictSelectError(msg)
 
     def strict_get(self, key: str) -> str:
         """.get that will raise an exception if no matches are found.
@@ -186,18 +524,91 @@ class StrictTag(Tag):
         Returns the value of the 'key' attribute for the tag, or the value given
         for 'default' if it doesn't have that attribute.
 
+        Multi-valued attributes such as class are joined with spaces.
+
         Args:
             key: The string used to select attributes from the element.
 
         Raises:
             StrictSelectError: When no matches are found.
         """
-        output = self.get(key)
-        if not isinstance(output, str):
-            msg = f"No matches found for strict_get({key})"
-            raise StrictSelectError(msg)
+        # Reading attrs directly skips the extra call through Tag.get.
+        output = self.attrs.get(key)
+        if isinstance(output, str):
+            return output
 
-        return output
+        if isinstance(output, list) and output and isinstance(output[0], str):
+            return " ".join(output)
+
+        msg = f"No matches found for strict_get({key})"
+        raise StrictSelectError(msg)
+
+    def strict_get_many(self, selector: str, key: str) -> list[str]:
+        """strict_get for every tag that matches a selector.
+
+        Args:
+            selector: A string containing a CSS selector.
+
+            key: The string used to select attributes from each element.
+
+        Returns:
+            The value of the attribute for each matching tag, in document order.
+
+        Raises:
+            StrictSelectError: When no tags match the selector or a matching tag
+                is missing the attribute.
+        """
+        tags = self.strict_select(selector)
+        output = [tag.attrs.get(key) for tag in tags]
+        if all(isinstance(value, str) for value in output):
+            return output
+
+        # Let strict_get join multi-valued attributes and raise for missing ones.
+        return [tag.strict_get(key) for tag in tags]
+
+    def _mark_index_stale(self) -> None:
+        """Mark the index of the document this tag belongs to as stale."""
+        index = self.__dict__.get(_INDEX_KEY)
+        if index is not None:
+            index.stale = True
+
+    # append, extend, decompose, replace_with and the other methods that add or
+    # remove tags all go through insert or extract.
+    @override
+    def insert(
+        self,
+        position: int,
+        *new_children: PageElement | str,
+    ) -> list[PageElement] | None:
+        """.insert wrapper that marks the index of the document as stale.
+
+        Args:
+            position: The numeric position that should be occupied in
+                self.children by the new PageElements.
+
+            new_children: The PageElements to insert. Older versions of bs4
+                only accept one.
+
+        Returns:
+            Whatever the installed version of bs4 returns, a list of the
+            inserted PageElements or None.
+        """
+        self._mark_index_stale()
+        return super().insert(position, *new_children)
+
+    @override
+    def extract(self, _self_index: int | None = None) -> Self:
+        """.extract wrapper that marks the index of the document as stale.
+
+        Args:
+            _self_index: The location of this element in its parent's .contents,
+                if known.
+
+        Returns:
+            self, no longer part of the tree.
+        """
+        self._mark_index_stale()
+        return super().extract(_self_index)
 
 
 # This error is present in the original beautifulsoup class because
@@ -236,6 +647,98 @@ class StrictSoup(BeautifulSoup, StrictTag):  # type: ignore[reportIncompatibleMe
     handle_endtag.
     """
 
+    def _index_lookup(
+        self,
+        selector: str | sv.SoupSieve,
+        namespaces: dict[str, str] | None,
+        kwargs: dict[str, Any],
+    ) -> list[Tag] | None:
+        """Find the tags matching a selector using the index.
+
+        Args:
+            selector: The selector passed into select.
+
+            namespaces: The namespaces passed into select.
+
+            kwargs: The keyword arguments passed into select.
+
+        Returns:
+            The matching tags, or None if the index can't be used.
+        """
+        if (
+            not self.indexed
+            or not isinstance(selector, str)
+            or namespaces is not None
+            or kwargs
+            or self.is_xml
+        ):
+            return None
+
+        if self._index is None or self._index.stale:
+            self._index = _SelectorIndex(self)
+
+        return self._index.lookup(selector)
+
+    @override
+    def select(  # type: ignore[reportIncompatibleMethodOverride]
+        self,
+        selector: str,
+        namespaces: Any | None = None,
+        limit: int | None = None,
+        **kwargs: Any,
+    ) -> ResultSet[StrictTag]:
+        """StrictTag.select that uses the index for #id, .class and tag names.
+
+        Args:
+            selector: A string containing a CSS selector.
+
+            namespaces: A dictionary mapping namespace prefixes used in the CSS
+                selector to namespace URIs. By default, Beautiful Soup will use
+                the prefixes it encountered while parsing the document.
+
+            limit: After finding this number of results, stop looking.
+
+            kwargs: Keyword arguments to be passed into SoupSieve's
+                soupsieve.select() method.
+
+        Returns:
+            A ResultSet of StrictTag objects.
+        """
+        tags = self._index_lookup(selector, namespaces, kwargs)
+        if tags is None:
+            return super().select(selector, namespaces, limit, **kwargs)
+
+        # Slicing copies the list so changes to the result don't affect the index.
+        return cast("ResultSet[StrictTag]", ResultSet(None, tags[: limit or None]))
+
+    @override
+    def select_one(
+        self,
+        selector: str,
+        namespaces: Any | None = None,
+        **kwargs: Any,
+    ) -> StrictTag | None:
+        """StrictTag.select_one that uses the index for #id, .class and tag names.
+
+        Args:
+            selector: A string containing a CSS selector.
+
+            namespaces: A dictionary mapping namespace prefixes used in the CSS
+                selector to namespace URIs. By default, Beautiful Soup will use
+                the prefixes it encountered while parsing the document.
+
+            kwargs: Keyword arguments to be passed into SoupSieve's
+                soupsieve.select() method.
+
+        Returns:
+            A StrictTag or None.
+        """
+        tags = self._index_lookup(selector, namespaces, kwargs)
+        if tags is None:
+            return super().select_one(selector, namespaces, **kwargs)
+
+        return cast("StrictTag", tags[0]) if tags else None
+
     def insert_after(self, *args: PageElement | str) -> None:
         """Dummy function that raises an error."""
         msg = f"This is not implemented, the args of {args} do nothing."
@@ -256,8 +759,59 @@ class StrictSoup(BeautifulSoup, StrictTag):  # type: ignore[reportIncompatibleMe
         from_encoding: str | None = None,
         exclude_encodings: Sequence[str] | None = None,
         element_classes: dict[type[PageElement], type[Any]] | None = None,
+        *,
+        force_parser: bool = False,
+        indexed: bool = False,
         **kwargs: Any,
     ) -> None:
+        """Parse a document.
+
+        When features is html.parser or None and lxml is installed, lxml is used
+        instead because it is 5-10x faster and uses less memory. lxml can build
+        a different tree than html.parser for broken HTML, pass
+        force_parser=True to always use the requested parser.
+
+        Args:
+            markup: A string or a file-like object representing markup to be
+                parsed.
+
+            features: The parser to use.
+
+            builder: A TreeBuilder subclass or instance to use instead of looking
+                one up based on features.
+
+            parse_only: A SoupStrainer, only parts of the document matching it
+                will be parsed.
+
+            from_encoding: A string indicating the encoding of the document.
+
+            exclude_encodings: A list of strings indicating encodings known to be
+                wrong.
+
+            element_classes: A dictionary mapping BeautifulSoup classes like Tag
+                and NavigableString to other classes to use instead.
+
+            force_parser: Use features as is even if lxml is available.
+
+            indexed: Answer #id, .class and tag name selectors run on the whole
+                document from an index that is built on first use. Adding or
+                removing tags rebuilds the index, but changing the attributes or
+                the name of a tag does not, so avoid changing attributes or
+                renaming tags in indexed documents.
+
+            kwargs: Keyword arguments to be passed into BeautifulSoup.
+        """
+        if (
+            not force_parser
+            and builder is None
+            and features in (None, "html.parser")
+            and _lxml_available()
+        ):
+            features = "lxml"
+
+        self.indexed = indexed
+        self._index: _SelectorIndex | None = None
+
         # This error is from bs4 itself and can be ignored.
         super().__init__(  # type: ignore[reportIncompatibleMethodOverride]
             markup,
@@ -269,3 +823,64 @@ class StrictSoup(BeautifulSoup, StrictTag):  # type: ignore[reportIncompatibleMe
             element_classes,
             **kwargs,
         )
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def parse_cached(cls, markup: str, features: str = "lxml") -> Self:
+        """Parse a document, reusing the result when it is parsed again.
+
+        The same object is returned every time the same markup and features are
+        used, so it must be treated as read-only.
+
+        Args:
+            markup: A string representing markup to be parsed.
+
+            features: The parser to use.
+
+        Returns:
+            A StrictSoup for the markup.
+        """
+        return cls(markup, features)
+
+    @classmethod
+    def from_selector(
+        cls,
+        markup: str | bytes | SupportsRead[str] | SupportsRead[bytes],
+        selector: str,
+        features: str | Sequence[str] | None = "lxml",
+        **kwargs: Any,  # noqa: ANN401 - Passed through to __init__
+    ) -> Self:
+        """Parse only the parts of the document that match a simple selector.
+
+        The selector is converted into a SoupStrainer so the parser skips
+        building every tag that can't match, which makes parsing large
+        documents faster and uses less memory. Matching tags keep all of their
+        children.
+
+        Args:
+            markup: A string or a file-like object representing markup to be
+                parsed.
+
+            selector: A CSS selector made of an optional tag name followed by
+                any number of #id, .class, [attr] and [attr=value] parts. Names
+                and values are matched with the same case rules as select, but
+                case flags such as [attr=value i] are not supported.
+
+            features: The parser to use.
+
+            kwargs: Keyword arguments to be passed into StrictSoup.
+
+        Returns:
+            A StrictSoup containing only the matching tags.
+
+        Raises:
+            ValueError: When the selector is too complex to convert.
+        """
+        # Look up the builder the same way BeautifulSoup does to find out if the
+        # document will be parsed as XML, where names are case-sensitive.
+        feature_list = [features] if isinstance(features, str) else features or []
+        builder = builder_registry.lookup(*feature_list)
+        html = builder is None or not builder.is_xml
+
+        strainer = _selector_to_strainer(selector, html=html)
+        return cls(markup, features, parse_only=strainer, **kwargs)
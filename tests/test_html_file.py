@@ -1,6 +1,7 @@
 """Test the StrictSoup class."""
 
 import pytest
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from src.strict_soup import StrictSelectError, StrictSoup
@@ -9,7 +10,7 @@ from src.strict_soup import StrictSelectError, StrictSoup
 PARSED_HTML = StrictSoup(
     """<h1 value="123"><text>H1 Test</text></h1>
     <h2><text>H2 Test 1</text></h2><h2>H2 Text 2</h2>""",
-    "html.parser",
+    "lxml",
 )
 
 PARSED_BS4 = BeautifulSoup(
@@ -32,6 +33,146 @@ class TestBS4:
         assert not callable(getattr(h2, "strict_select_one", None))
         assert not callable(getattr(h2, "strict_get", None))
 
+
+class TestParser:
+    def test_html_parser_replaced(self) -> None:
+        soup = StrictSoup("<h1></h1>", "html.parser")
+        assert soup.builder.NAME == "lxml"
+
+    def test_force_parser(self) -> None:
+        soup = StrictSoup("<h1></h1>", "html.parser", force_parser=True)
+        assert soup.builder.NAME == "html.parser"
+
+
+class TestSelect:
+    def test_repeated_selector(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+        compile_selector = sv.compile
+
+        def counting_compile(pattern: str, *args: object) -> sv.SoupSieve:
+            calls.append(pattern)
+            return compile_selector(pattern, *args)  # type: ignore[reportArgumentType]
+
+        monkeypatch.setattr(sv, "compile", counting_compile)
+        PARSED_HTML.select("h1 > text")
+        PARSED_HTML.select("h1 > text")
+        assert calls.count("h1 > text") == 1
+
+    def test_precompiled_selector(self) -> None:
+        selector = sv.compile("h2")
+        result = PARSED_HTML.select(selector)
+        assert str(result) == "[<h2><text>H2 Test 1</text></h2>, <h2>H2 Text 2</h2>]"
+        assert callable(getattr(result[0], "strict_select", None))
+        result_one = PARSED_HTML.select_one(selector)
+        assert str(result_one) == "<h2><text>H2 Test 1</text></h2>"
+
+    def test_tag_name_limit(self) -> None:
+        result = PARSED_HTML.select("h2", limit=1)
+        assert str(result) == "[<h2><text>H2 Test 1</text></h2>]"
+        assert callable(getattr(result[0], "strict_select", None))
+
+    def test_tag_name_keeps_case(self) -> None:
+        soup = StrictSoup(
+            "<svg><foreignObject><p>1</p></foreignObject></svg>",
+            "html5lib",
+        )
+        assert str(soup.select("foreignobject")) == str(soup.select("svg > *"))
+        assert soup.select_one("foreignobject") is soup.select_one("svg > *")
+
+    def test_tag_name_matches_soupsieve(self) -> None:
+        assert PARSED_HTML.select("text") == PARSED_HTML.select("h1 text, h2 text")
+
+    def test_uncached_kwargs(self) -> None:
+        result = PARSED_HTML.select(":--heading", custom={":--heading": "h1"})
+        assert str(result) == '[<h1 value="123"><text>H1 Test</text></h1>]'
+        assert callable(getattr(result[0], "strict_select", None))
+
+
+class TestParseCached:
+    def test_same_markup(self) -> None:
+        soup = StrictSoup.parse_cached("<h1>Cached</h1>")
+        assert StrictSoup.parse_cached("<h1>Cached</h1>") is soup
+
+    def test_different_features(self) -> None:
+        soup = StrictSoup.parse_cached("<h1>Cached</h1>")
+        assert StrictSoup.parse_cached("<h1>Cached</h1>", "html.parser") is not soup
+
+
+class TestIndexed:
+    def test_matches_unindexed(self) -> None:
+        markup = '<p id="a" class="x y">1</p><p class="y">2</p><span class="y">3</span>'
+        indexed = StrictSoup(markup, indexed=True)
+        plain = StrictSoup(markup)
+        for selector in ["#a", ".y", "p", "#missing", "p.y"]:
+            assert indexed.select(selector) == plain.select(selector)
+            assert indexed.select_one(selector) == plain.select_one(selector)
+
+    def test_limit(self) -> None:
+        soup = StrictSoup('<p class="y">1</p><p class="y">2</p>', indexed=True)
+        result = soup.select(".y", limit=1)
+        assert str(result) == '[<p class="y">1</p>]'
+        assert callable(getattr(result[0], "strict_select", None))
+
+    def test_precompiled_selector(self) -> None:
+        soup = StrictSoup("<p>1</p><p>2</p>", indexed=True)
+        assert str(soup.select(sv.compile("p"))) == "[<p>1</p>, <p>2</p>]"
+
+    def test_decompose(self) -> None:
+        soup = StrictSoup("<div><p>1</p></div>", indexed=True)
+        soup.strict_select_one("p").decompose()
+        assert str(soup.select("p")) == "[]"
+
+    def test_append(self) -> None:
+        soup = StrictSoup("<div><p>1</p></div>", indexed=True)
+        soup.select("p")
+        soup.strict_select_one("div").append(soup.new_tag("p"))
+        soup.append(soup.new_tag("p"))
+        assert str(soup.select("p")) == "[<p>1</p>, <p></p>, <p></p>]"
+
+    def test_tag_name_keeps_case(self) -> None:
+        markup = "<svg><foreignObject>1</foreignObject></svg>"
+        soup = StrictSoup(markup, "html5lib", indexed=True)
+        assert str(soup.select("foreignobject")) == "[<foreignObject>1</foreignObject>]"
+
+
+class TestFromSelector:
+    def test_only_matches_parsed(self) -> None:
+        soup = StrictSoup.from_selector(
+            '<div><a class="x y">A</a><a class="xy">B</a></div>',
+            "a.y.x",
+        )
+        assert str(soup) == '<a class="x y">A</a>'
+        assert soup.strict_select_one("a").strict_get("class") == "x y"
+
+    def test_matches_select(self) -> None:
+        markup = (
+            '<div><a id="m" class="x" type="Text">A</a><b DATA-K="v">B</b><a>C</a>'
+            '<i title="Text">D</i></div>'
+        )
+        plain = StrictSoup(markup)
+        selectors = ["A", "a#m", "[data-k=v]", "B[DATA-K='v']", ".x", "a[id]"]
+        selectors += ["[type=text]", "[title=text]", "[title=Text]"]
+        for selector in selectors:
+            strained = StrictSoup.from_selector(markup, selector)
+            assert strained.select(selector) == plain.select(selector)
+
+    def test_xml_names_case_sensitive(self) -> None:
+        soup = StrictSoup.from_selector("<r><A>1</A><a>2</a></r>", "A", "xml")
+        assert str(soup.select("A")) == "[<A>1</A>]"
+
+    def test_class_and_class_attribute(self) -> None:
+        with pytest.raises(ValueError, match=r"\.class and \[class\]"):
+            StrictSoup.from_selector("<a class='x y'></a>", "a[class=x].y")
+
+    def test_case_flag(self) -> None:
+        with pytest.raises(ValueError, match="too complex"):
+            StrictSoup.from_selector("<a type='Text'></a>", "[type=text i]")
+
+    def test_complex_selector(self) -> None:
+        with pytest.raises(ValueError, match="too complex"):
+            StrictSoup.from_selector("<div><a>A</a></div>", "div > a")
+
+
 class TestStrictSelect:
     def test_multiple_matches(self) -> None:
         result = PARSED_HTML.strict_select("h2")
@@ -62,7 +203,7 @@ class TestStrictSelectOne:
             PARSED_HTML.strict_select_one("h3")
 
     def test_multiple_matches(self) -> None:
-        with pytest.raises(StrictSelectError):
+        with pytest.raises(StrictSelectError, match="multiple matches"):
             PARSED_HTML.strict_select_one("h2")
 
     def test_child_matches(self) -> None:
@@ -79,3 +220,30 @@ class TestStrictGet:
         tag = PARSED_HTML.strict_select_one("h1")
         with pytest.raises(StrictSelectError):
             tag.strict_get("missing_value")
+
+    def test_str_subclass_match(self) -> None:
+        soup = StrictSoup('<meta charset="utf-8">', "lxml")
+        assert soup.strict_select_one("meta").strict_get("charset") == "utf-8"
+
+    def test_multi_valued_match(self) -> None:
+        soup = StrictSoup('<p class="first second"></p>', "lxml")
+        assert soup.strict_select_one("p").strict_get("class") == "first second"
+
+
+class TestStrictGetMany:
+    def test_match(self) -> None:
+        soup = StrictSoup('<a href="1"></a><a href="2" class="x y"></a>', "lxml")
+        assert soup.strict_get_many("a", "href") == ["1", "2"]
+
+    def test_multi_valued_match(self) -> None:
+        soup = StrictSoup('<a class="x"></a><a class="x y"></a>', "lxml")
+        assert soup.strict_get_many("a", "class") == ["x", "x y"]
+
+    def test_str_subclass_match(self) -> None:
+        soup = StrictSoup('<meta charset="utf-8"><meta charset="ascii">', "lxml")
+        assert soup.strict_get_many("meta", "charset") == ["utf-8", "ascii"]
+
+    def test_no_match(self) -> None:
+        soup = StrictSoup('<a href="1"></a><a></a>', "lxml")
+        with pytest.raises(StrictSelectError):
+            soup.strict_get_many("a", "href")